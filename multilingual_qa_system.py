@@ -18,9 +18,237 @@ Author: Data Science Portfolio
 """
 
 import numpy as np
+from dataclasses import dataclass, field
 from typing import List, Dict, Tuple
+import hashlib
 import json
 import os
+import sys
+import threading
+import zlib
+
+# Optional: FAISS provides SIMD-vectorized similarity search. When it is not
+# installed, the system falls back to the pure-Python word-overlap search.
+try:
+    import faiss
+    FAISS_AVAILABLE = True
+except ImportError:
+    faiss = None
+    FAISS_AVAILABLE = False
+
+# GPU search needs the faiss-gpu build and at least one visible device;
+# faiss-cpu installs expose neither, so this degrades to CPU quietly.
+FAISS_GPU_AVAILABLE = (FAISS_AVAILABLE
+                       and hasattr(faiss, 'StandardGpuResources')
+                       and faiss.get_num_gpus() > 0)
+
+# Optional: Numba JIT-compiles the word-overlap scoring loop. Without it,
+# the word-overlap fallback uses plain Python set operations.
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Optional: orjson serializes at C speed; the standard library json module
+# is the fallback.
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+# Optional: the third-party regex module supports Unicode property classes;
+# the standard library re module's \w is a close fallback.
+try:
+    import regex as _re_module
+    _WORD_PATTERN = _re_module.compile(r'[\p{L}\p{N}]+')
+except ImportError:
+    import re as _re_module
+    _WORD_PATTERN = _re_module.compile(r'\w+', _re_module.UNICODE)
+
+# Dimensionality of the hashed bag-of-words embeddings used for the FAISS index.
+EMBEDDING_DIM = 256
+
+# Largest vocabulary for which token sets are additionally packed into
+# fixed-width uint64 bitsets; Jaccard then reduces to popcounts over
+# AND/OR words. Past this limit only the token-ID spans are kept.
+BITSET_VOCAB_LIMIT = 4096
+_BITSET_WORDS = BITSET_VOCAB_LIMIT // 64
+
+# Knowledge base sizes at which the FAISS index switches to compressed
+# storage: 8-bit scalar quantization halves the bytes scanned per query,
+# and IVF+PQ bounds both memory and scan cost for very large bases.
+SQ8_THRESHOLD = 256
+IVFPQ_THRESHOLD = 100_000
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True, fastmath=True)
+    def _jaccard_kernel(q_ids, q_total, tok_ids, tok_off, out):
+        """Jaccard similarity of sorted query token IDs against each KB span.
+
+        ``tok_ids`` is one contiguous array of sorted token IDs; ``tok_off``
+        holds (start, length) per span. Intersections are counted with a
+        two-pointer merge, parallelized across spans.
+        """
+        for i in prange(tok_off.shape[0]):
+            start = tok_off[i, 0]
+            end = start + tok_off[i, 1]
+            intersection = 0
+            a = 0
+            b = start
+            while a < q_ids.shape[0] and b < end:
+                if q_ids[a] == tok_ids[b]:
+                    intersection += 1
+                    a += 1
+                    b += 1
+                elif q_ids[a] < tok_ids[b]:
+                    a += 1
+                else:
+                    b += 1
+            union = q_total + tok_off[i, 1] - intersection
+            out[i] = intersection / union if union > 0 else 0.0
+
+    @njit(cache=True, inline='always')
+    def _popcount64(x):
+        """Count set bits in a uint64 word (SWAR, no branches)."""
+        x = x - ((x >> np.uint64(1)) & np.uint64(0x5555555555555555))
+        x = ((x & np.uint64(0x3333333333333333))
+             + ((x >> np.uint64(2)) & np.uint64(0x3333333333333333)))
+        x = (x + (x >> np.uint64(4))) & np.uint64(0x0F0F0F0F0F0F0F0F)
+        return (x * np.uint64(0x0101010101010101)) >> np.uint64(56)
+
+    @njit(parallel=True, cache=True, fastmath=True)
+    def _jaccard_bits_kernel(q_bits, kb_bits, q_extra, out):
+        """Jaccard similarity of a query bitset against each KB row bitset.
+
+        ``q_extra`` counts query tokens outside the vocabulary; they cannot
+        intersect anything but still belong in the union.
+        """
+        for i in prange(kb_bits.shape[0]):
+            intersection = np.uint64(0)
+            union = np.uint64(0)
+            for w in range(kb_bits.shape[1]):
+                intersection += _popcount64(q_bits[w] & kb_bits[i, w])
+                union += _popcount64(q_bits[w] | kb_bits[i, w])
+            total = union + np.uint64(q_extra)
+            out[i] = intersection / total if total > 0 else 0.0
+
+def _is_cjk(char: str) -> bool:
+    """Return True for Han, Hiragana, or Katakana characters."""
+    return ('\u4e00' <= char <= '\u9fff'    # CJK Unified Ideographs
+            or '\u3400' <= char <= '\u4dbf'  # CJK Extension A
+            or '\u3040' <= char <= '\u30ff'  # Hiragana and Katakana
+            or '\uf900' <= char <= '\ufaff')  # CJK Compatibility Ideographs
+
+
+@dataclass
+class KnowledgeColumns:
+    """
+    Columnar (structure-of-arrays) storage for knowledge base entries.
+
+    Scans over a single column touch contiguous memory instead of chasing
+    one dict per entry; dict form is materialized only at API boundaries.
+    The NumPy-backed columns grow in chunks so appends stay amortized O(1).
+    """
+
+    # Arrays grow by this many slots at a time; len(self) is the logical size
+    GROWTH_CHUNK = 1024
+
+    ids: np.ndarray = field(
+        default_factory=lambda: np.empty(0, dtype=np.int64))
+    language_ids: np.ndarray = field(
+        default_factory=lambda: np.empty(0, dtype=np.uint16))
+    language_vocab: List[str] = field(default_factory=list)
+    category_ids: np.ndarray = field(
+        default_factory=lambda: np.empty(0, dtype=np.uint16))
+    category_vocab: List[str] = field(default_factory=list)
+    questions: List[str] = field(default_factory=list)
+    answers: List[str] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.questions)
+
+    def id_array(self) -> np.ndarray:
+        """Return a view of the populated portion of the id column."""
+        return self.ids[:len(self)]
+
+    def language_id_array(self) -> np.ndarray:
+        """Return a view of the populated portion of the language-ID column."""
+        return self.language_ids[:len(self)]
+
+    def category_id_array(self) -> np.ndarray:
+        """Return a view of the populated portion of the category-ID column."""
+        return self.category_ids[:len(self)]
+
+    @property
+    def languages(self) -> List[str]:
+        """Language code per entry, resolved from the categorical IDs."""
+        return [self.language_vocab[lang_id]
+                for lang_id in self.language_id_array()]
+
+    @property
+    def categories(self) -> List[str]:
+        """Category name per entry, resolved from the categorical IDs."""
+        return [self.category_vocab[cat_id]
+                for cat_id in self.category_id_array()]
+
+    @staticmethod
+    def _intern_value(value: str, vocab: List[str]) -> int:
+        """Return the vocab index for value, extending the vocab if new."""
+        value = sys.intern(value)
+        try:
+            return vocab.index(value)
+        except ValueError:
+            vocab.append(value)
+            return len(vocab) - 1
+
+    def append(self, entry_id: int, language: str, question: str,
+               answer: str, category: str):
+        """Append one entry across all columns."""
+        n = len(self)
+        if n == len(self.ids):
+            self.ids = np.concatenate(
+                [self.ids, np.zeros(self.GROWTH_CHUNK, dtype=np.int64)])
+            self.language_ids = np.concatenate(
+                [self.language_ids, np.zeros(self.GROWTH_CHUNK, dtype=np.uint16)])
+            self.category_ids = np.concatenate(
+                [self.category_ids, np.zeros(self.GROWTH_CHUNK, dtype=np.uint16)])
+        self.ids[n] = entry_id
+        # Languages and categories repeat heavily: store one interned name
+        # per distinct value and a small integer ID per entry. This also
+        # preserves codes of any length (a fixed-width string column would
+        # silently truncate e.g. 'zh-Hant-TW')
+        self.language_ids[n] = self._intern_value(language, self.language_vocab)
+        self.category_ids[n] = self._intern_value(category, self.category_vocab)
+        self.questions.append(question)
+        self.answers.append(answer)
+
+    def entry(self, i: int) -> Dict:
+        """Materialize entry i as a dictionary."""
+        return {
+            'id': int(self.ids[i]),
+            'language': self.language_vocab[self.language_ids[i]],
+            'question': self.questions[i],
+            'answer': self.answers[i],
+            'category': self.category_vocab[self.category_ids[i]]
+        }
+
+    def to_dicts(self) -> List[Dict]:
+        """Materialize all entries as a list of dictionaries."""
+        return [self.entry(i) for i in range(len(self))]
+
+    @classmethod
+    def from_dicts(cls, entries: List[Dict]) -> 'KnowledgeColumns':
+        """Build columnar storage from a list of entry dictionaries."""
+        columns = cls()
+        for item in entries:
+            columns.append(item['id'], item['language'], item['question'],
+                           item['answer'], item.get('category', 'General'))
+        return columns
+
 
 class MultilingualQASystem:
     """
@@ -31,13 +259,68 @@ class MultilingualQASystem:
     in different languages.
     """
     
-    def __init__(self):
-        """Initialize the QA system with sample knowledge base."""
-        self.knowledge_base = self._create_sample_knowledge_base()
+    def __init__(self, shared_index_dir: str = None):
+        """
+        Initialize the QA system with sample knowledge base.
+
+        Args:
+            shared_index_dir: Optional directory containing a prebuilt index
+                exported by export_shared_index (e.g. under /dev/shm). When
+                given, the index is memory-mapped read-only so multiple
+                worker processes share one resident copy.
+        """
+        self._columns = KnowledgeColumns.from_dicts(
+            self._create_sample_knowledge_base())
+        self._reset_next_id()
         self.supported_languages = ['en', 'es', 'fr', 'de', 'hi', 'zh', 'ar', 'ja']
+        self.index = None
+        self.id_map = []
+        self._cpu_index = None
+        self._gpu_resources = None
+        self.read_only = False
+        self._write_lock = threading.RLock()
+        self._emb_cache = {}
+        self._filter_cache = {}
+        self._filter_patterns = {}
+        self._q_tokens = []
+        self._a_tokens = []
+        self._vocab = {}
+        self._tok_ids = np.empty(0, dtype=np.uint32)
+        self._tok_off = np.empty((0, 2), dtype=np.int64)
+        self._kb_bits = np.empty((0, _BITSET_WORDS), dtype=np.uint64)
+        self._rebuild_token_sets()
+        if shared_index_dir and FAISS_AVAILABLE:
+            self._attach_shared_index(shared_index_dir)
+        elif FAISS_AVAILABLE:
+            self._build_index()
         print("Multilingual QA System initialized successfully!")
         print(f"Supported languages: {', '.join(self.supported_languages)}")
-        
+
+    @property
+    def knowledge_base(self) -> List[Dict]:
+        """Knowledge base entries as dictionaries, materialized on access.
+
+        Entries are stored internally in columnar form (:class:`KnowledgeColumns`);
+        this property exists for serialization and external callers.
+        """
+        return self._columns.to_dicts()
+
+    @knowledge_base.setter
+    def knowledge_base(self, entries: List[Dict]):
+        self._columns = KnowledgeColumns.from_dicts(entries)
+        self._reset_next_id()
+        # Keep the derived state (token sets, bitsets, vector index) in
+        # sync: replacing the entries with stale caches would silently
+        # return wrong search results.
+        self._rebuild_token_sets()
+        if FAISS_AVAILABLE:
+            self._build_index()
+
+    def _reset_next_id(self):
+        """Recompute the running ID counter from the stored entries."""
+        ids = self._columns.id_array()
+        self._next_id = int(ids.max()) + 1 if ids.size else 1
+
     def _create_sample_knowledge_base(self) -> List[Dict]:
         """
         Create a sample multilingual knowledge base with Q&A pairs.
@@ -119,6 +402,251 @@ class MultilingualQASystem:
         ]
         return knowledge_base
     
+    @staticmethod
+    def _tokenize(text: str) -> frozenset:
+        """
+        Tokenize text into a frozenset of casefolded Unicode word tokens.
+
+        Whitespace splitting produces a single useless token for scripts
+        written without spaces, so CJK words are expanded into character
+        bigrams instead. Tokenization happens once per text at insert or
+        query time; the resulting sets are what the similarity code compares.
+
+        Args:
+            text: Text string to tokenize
+
+        Returns:
+            Frozenset of token strings
+        """
+        tokens = set()
+        for word in _WORD_PATTERN.findall(text.casefold()):
+            if any(_is_cjk(char) for char in word):
+                # Character bigrams for Han/Hiragana/Katakana runs
+                if len(word) == 1:
+                    tokens.add(word)
+                else:
+                    for i in range(len(word) - 1):
+                        tokens.add(word[i:i + 2])
+            else:
+                tokens.add(word)
+        return frozenset(tokens)
+
+    def _rebuild_token_sets(self):
+        """Precompute token sets for every knowledge base entry.
+
+        Tokenizing each question and answer once at load/insert time means
+        the word-overlap search only performs set intersections per query
+        instead of re-splitting unchanged text on every call. The same
+        tokens are also packed into a structure-of-arrays token-ID layout
+        for the JIT-compiled scoring kernel.
+        """
+        self._q_tokens = [self._tokenize(question)
+                          for question in self._columns.questions]
+        self._a_tokens = [self._tokenize(answer)
+                          for answer in self._columns.answers]
+        self._vocab = {}
+        self._tok_ids = np.empty(0, dtype=np.uint32)
+        self._tok_off = np.empty((0, 2), dtype=np.int64)
+        self._kb_bits = np.empty((0, _BITSET_WORDS), dtype=np.uint64)
+        self._filter_cache.clear()
+        for qset, aset in zip(self._q_tokens, self._a_tokens):
+            self._append_token_spans(qset, aset)
+
+    def _token_ids(self, tokens: frozenset) -> np.ndarray:
+        """Map tokens to sorted uint32 IDs, growing the vocabulary as needed."""
+        vocab = self._vocab
+        ids = np.fromiter(
+            (vocab.setdefault(tok, len(vocab)) for tok in tokens),
+            dtype=np.uint32, count=len(tokens))
+        ids.sort()
+        return ids
+
+    def _append_token_spans(self, qset: frozenset, aset: frozenset):
+        """Append the question/answer token-ID spans of one KB entry."""
+        q_ids = self._token_ids(qset)
+        a_ids = self._token_ids(aset)
+        start = len(self._tok_ids)
+        self._tok_ids = np.concatenate([self._tok_ids, q_ids, a_ids])
+        self._tok_off = np.concatenate([
+            self._tok_off,
+            np.array([[start, len(q_ids)],
+                      [start + len(q_ids), len(a_ids)]], dtype=np.int64)])
+
+        if self._kb_bits is not None:
+            if len(self._vocab) > BITSET_VOCAB_LIMIT:
+                # Vocabulary outgrew the bitset width; drop the packed form
+                self._kb_bits = None
+            else:
+                rows = np.array([self._pack_bits(q_ids),
+                                 self._pack_bits(a_ids)], dtype=np.uint64)
+                self._kb_bits = np.concatenate([self._kb_bits, rows])
+
+    @staticmethod
+    def _pack_bits(token_ids) -> List[int]:
+        """Pack token IDs into a fixed-width list of uint64 bitset words."""
+        words = [0] * _BITSET_WORDS
+        for token_id in token_ids:
+            words[token_id >> 6] |= 1 << (int(token_id) & 63)
+        return words
+
+    @staticmethod
+    def _text_hash(text: str) -> str:
+        """Return a short stable content hash used as an embedding cache key."""
+        return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
+    def _embed_texts(self, texts: List[str]) -> np.ndarray:
+        """
+        Embed a list of texts into L2-normalized float32 vectors.
+
+        Embeddings are cached by content hash, so re-encoding the same
+        knowledge base entry or a repeated query is a dictionary lookup
+        rather than a fresh encoding pass.
+
+        Uses a hashed bag-of-words projection so the system stays
+        self-contained. A production deployment would swap in LaReQA/LaBSE
+        sentence embeddings here without changing any other code.
+
+        Args:
+            texts: List of text strings to embed
+
+        Returns:
+            Array of shape (len(texts), EMBEDDING_DIM), L2-normalized
+        """
+        embeddings = np.zeros((len(texts), EMBEDDING_DIM), dtype=np.float32)
+        for row, text in enumerate(texts):
+            key = self._text_hash(text)
+            cached = self._emb_cache.get(key)
+            if cached is not None:
+                embeddings[row] = cached
+                continue
+            for word in self._tokenize(text):
+                # Feature hashing: bucket and sign derived from a stable hash
+                # (zlib.crc32 is deterministic across processes, unlike hash())
+                h = zlib.crc32(word.encode('utf-8'))
+                bucket = h % EMBEDDING_DIM
+                sign = 1.0 if (h >> 16) & 1 else -1.0
+                embeddings[row, bucket] += sign
+            norm = np.linalg.norm(embeddings[row])
+            if norm > 0:
+                embeddings[row] /= norm
+            self._emb_cache[key] = embeddings[row].copy()
+        return embeddings
+
+    @staticmethod
+    def _make_index(n_entries: int):
+        """
+        Create index storage appropriate for the knowledge base size.
+
+        Small bases use exact flat storage; past SQ8_THRESHOLD entries the
+        vectors are stored 8-bit scalar-quantized, and past IVFPQ_THRESHOLD
+        an IVF+PQ index bounds memory and scan cost. Searches are unchanged
+        either way — only the backing storage differs.
+
+        Args:
+            n_entries: Number of vectors the index will hold
+
+        Returns:
+            An (untrained) FAISS inner-product index
+        """
+        if n_entries >= IVFPQ_THRESHOLD:
+            nlist = int(4 * np.sqrt(n_entries))
+            quantizer = faiss.IndexFlatIP(EMBEDDING_DIM)
+            index = faiss.IndexIVFPQ(quantizer, EMBEDDING_DIM, nlist,
+                                     EMBEDDING_DIM // 4, 8,
+                                     faiss.METRIC_INNER_PRODUCT)
+            index.nprobe = 16
+            return index
+        if n_entries >= SQ8_THRESHOLD:
+            return faiss.IndexScalarQuantizer(
+                EMBEDDING_DIM, faiss.ScalarQuantizer.QT_8bit,
+                faiss.METRIC_INNER_PRODUCT)
+        return faiss.IndexFlatIP(EMBEDDING_DIM)
+
+    def _build_index(self):
+        """Build the FAISS inner-product index over the knowledge base."""
+        self.index = self._make_index(len(self._columns))
+        self.id_map = []
+        if len(self._columns):
+            texts = [question + ' ' + answer
+                     for question, answer in zip(self._columns.questions,
+                                                 self._columns.answers)]
+            embeddings = self._embed_texts(texts)
+            if not self.index.is_trained:
+                self.index.train(embeddings)
+            self.index.add(embeddings)
+            self.id_map = list(range(len(self._columns)))
+        # Keep the CPU index as the persistence mirror; search on GPU when
+        # a faiss-gpu build and a device are available
+        self._cpu_index = self.index
+        if FAISS_GPU_AVAILABLE:
+            self._gpu_resources = faiss.StandardGpuResources()
+            self.index = faiss.index_cpu_to_gpu(self._gpu_resources, 0,
+                                                self._cpu_index)
+
+    def _index_add(self, embeddings: np.ndarray):
+        """Add embeddings to the search index and its CPU mirror."""
+        self.index.add(embeddings)
+        if self._cpu_index is not None and self._cpu_index is not self.index:
+            self._cpu_index.add(embeddings)
+
+    def export_shared_index(self, directory: str):
+        """
+        Export the knowledge base and FAISS index for shared-memory use.
+
+        Writes the KB JSON, the serialized index, and the raw embedding
+        matrix into ``directory`` (typically under /dev/shm) so worker
+        processes can attach with memory-mapping instead of each building
+        a private copy.
+
+        Args:
+            directory: Destination directory for the shared files
+        """
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, 'knowledge_base.json'), 'w',
+                  encoding='utf-8') as f:
+            json.dump(self.knowledge_base, f, ensure_ascii=False)
+        # Snapshot from the CPU mirror; GPU indexes are not serializable
+        cpu_index = self._cpu_index if self._cpu_index is not None else self.index
+        faiss.write_index(cpu_index, os.path.join(directory, 'kb.faiss'))
+        embeddings = cpu_index.reconstruct_n(0, cpu_index.ntotal)
+        np.save(os.path.join(directory, 'kb_emb.npy'), embeddings)
+        print(f"\n✓ Shared index exported to {directory}")
+
+    def _attach_shared_index(self, directory: str):
+        """
+        Attach to a prebuilt index via memory-mapping, read-only.
+
+        Falls back to building a private index when the shared files are
+        missing.
+
+        Args:
+            directory: Directory populated by export_shared_index
+        """
+        kb_file = os.path.join(directory, 'knowledge_base.json')
+        index_file = os.path.join(directory, 'kb.faiss')
+        emb_file = os.path.join(directory, 'kb_emb.npy')
+
+        if not (os.path.exists(kb_file) and os.path.exists(index_file)):
+            print(f"\n✗ No shared index found in {directory}; building locally")
+            self._build_index()
+            return
+
+        with open(kb_file, 'r', encoding='utf-8') as f:
+            # Assign the columns directly rather than through the
+            # knowledge_base setter: the setter would build a private
+            # index that the mapped one below immediately replaces
+            self._columns = KnowledgeColumns.from_dicts(json.load(f))
+        self._reset_next_id()
+        self._rebuild_token_sets()
+        self.index = faiss.read_index(index_file, faiss.IO_FLAG_MMAP)
+        self._cpu_index = self.index
+        self.id_map = list(range(self.index.ntotal))
+        if os.path.exists(emb_file):
+            # Mapped read-only: all workers share the same physical pages
+            self._emb_matrix = np.load(emb_file, mmap_mode='r')
+        self.read_only = True
+        print(f"\n✓ Attached shared read-only index from {directory}")
+
     def simple_text_similarity(self, text1: str, text2: str) -> float:
         """
         Calculate simple text similarity based on word overlap.
@@ -133,53 +661,250 @@ class MultilingualQASystem:
         Returns:
             Similarity score between 0 and 1
         """
-        # Convert to lowercase and split into words
-        words1 = set(text1.lower().split())
-        words2 = set(text2.lower().split())
-        
-        # Calculate Jaccard similarity
-        intersection = len(words1.intersection(words2))
-        union = len(words1.union(words2))
-        
+        return self._jaccard(self._tokenize(text1), self._tokenize(text2))
+
+    @staticmethod
+    def _jaccard(tokens1: frozenset, tokens2: frozenset) -> float:
+        """
+        Calculate the Jaccard similarity of two token sets.
+
+        Args:
+            tokens1: First token set
+            tokens2: Second token set
+
+        Returns:
+            Similarity score between 0 and 1
+        """
+        union = len(tokens1 | tokens2)
         if union == 0:
             return 0.0
-        
-        return intersection / union
+        return len(tokens1 & tokens2) / union
     
-    def search_answers(self, query: str, top_k: int = 3) -> List[Dict]:
+    def _filter_mask(self, filters: Dict) -> np.ndarray:
+        """
+        Build a boolean mask of entries matching the given filters.
+
+        Filter values are compiled once into a single alternation pattern
+        (matching is linear in the input, independent of the value count)
+        and the resulting masks are cached until the knowledge base changes.
+
+        Args:
+            filters: Mapping of 'language' and/or 'category' to a value or
+                list of accepted values
+
+        Returns:
+            Boolean array aligned with the knowledge base entries
+        """
+        columns = {
+            'language': self._columns.languages,
+            'category': self._columns.categories,
+        }
+        normalized = []
+        for field_name, values in sorted(filters.items()):
+            if field_name not in columns:
+                raise ValueError(f"Unsupported filter field: {field_name}")
+            if isinstance(values, str):
+                values = [values]
+            normalized.append((field_name, tuple(sorted(values))))
+
+        cache_key = tuple(normalized)
+        mask = self._filter_cache.get(cache_key)
+        if mask is not None and len(mask) == len(self._columns):
+            return mask
+
+        mask = np.ones(len(self._columns), dtype=bool)
+        for field_name, values in normalized:
+            pattern = self._filter_patterns.get((field_name, values))
+            if pattern is None:
+                pattern = _re_module.compile(
+                    '|'.join(_re_module.escape(v) for v in values))
+                self._filter_patterns[(field_name, values)] = pattern
+            mask &= np.fromiter(
+                (pattern.fullmatch(str(value)) is not None
+                 for value in columns[field_name]),
+                dtype=bool, count=len(self._columns))
+
+        self._filter_cache[cache_key] = mask
+        return mask
+
+    def search_answers(self, query: str, top_k: int = 3,
+                       filters: Dict = None) -> List[Dict]:
         """
         Search for relevant answers in the knowledge base.
-        
+
         Args:
             query: User's question
             top_k: Number of top results to return
-            
+            filters: Optional mapping of 'language'/'category' to accepted
+                values; only matching entries are returned
+
+        Returns:
+            List of top-k relevant Q&A pairs with similarity scores
+        """
+        mask = self._filter_mask(filters) if filters else None
+        if self.index is not None:
+            return self._search_answers_faiss(query, top_k, mask)
+        if NUMBA_AVAILABLE:
+            return self._search_answers_numba(query, top_k, mask)
+
+        # Tokenize the query once; KB token sets are precomputed
+        query_tokens = self._tokenize(query)
+
+        scores = np.empty(len(self._columns), dtype=np.float32)
+        for i, (qset, aset) in enumerate(zip(self._q_tokens, self._a_tokens)):
+            # Jaccard similarity against the cached question and answer sets
+            scores[i] = max(self._jaccard(query_tokens, qset),
+                            self._jaccard(query_tokens, aset))
+
+        if mask is not None:
+            scores = np.where(mask, scores, -1.0)
+        return self._top_k_results(scores, top_k)
+
+    def _top_k_results(self, scores: np.ndarray, top_k: int) -> List[Dict]:
+        """
+        Select the top-k scoring entries and materialize result dicts.
+
+        Uses np.argpartition (O(N)) rather than a full sort, and only builds
+        dictionaries for the k returned entries.
+
+        Args:
+            scores: Per-entry similarity scores, aligned with knowledge_base
+            top_k: Number of top results to return
+
         Returns:
             List of top-k relevant Q&A pairs with similarity scores
         """
+        # Guard degenerate inputs: argpartition with top_k == 0 would slice
+        # [-0:] and return the whole array
+        if top_k <= 0 or scores.size == 0 or scores.max() == 0:
+            return []
+
+        top_k = min(top_k, len(scores))
+        idx = np.argpartition(scores, -top_k)[-top_k:]
+        idx = idx[np.argsort(-scores[idx])]
+
         results = []
-        
-        for item in self.knowledge_base:
-            # Calculate similarity with question and answer
-            q_similarity = self.simple_text_similarity(query, item['question'])
-            a_similarity = self.simple_text_similarity(query, item['answer'])
-            
-            # Take the maximum similarity
-            max_similarity = max(q_similarity, a_similarity)
-            
-            results.append({
-                'id': item['id'],
-                'question': item['question'],
-                'answer': item['answer'],
-                'language': item['language'],
-                'category': item['category'],
-                'similarity_score': max_similarity
-            })
-        
-        # Sort by similarity score in descending order
-        results.sort(key=lambda x: x['similarity_score'], reverse=True)
-        
-        return results[:top_k]
+        for i in idx:
+            if scores[i] < 0:
+                # Entry excluded by a search filter
+                continue
+            result = self._columns.entry(i)
+            result['similarity_score'] = float(scores[i])
+            results.append(result)
+
+        return results
+
+    def _search_answers_numba(self, query: str, top_k: int,
+                              mask: np.ndarray = None) -> List[Dict]:
+        """
+        Score the knowledge base with the JIT-compiled Jaccard kernel.
+
+        Args:
+            query: User's question
+            top_k: Number of top results to return
+            mask: Optional boolean mask restricting which entries may match
+
+        Returns:
+            List of top-k relevant Q&A pairs with similarity scores
+        """
+        query_tokens = self._tokenize(query)
+        q_ids = np.array(
+            sorted(self._vocab[tok] for tok in query_tokens
+                   if tok in self._vocab),
+            dtype=np.uint32)
+
+        out = np.empty(self._tok_off.shape[0], dtype=np.float32)
+        if self._kb_bits is not None:
+            # Small vocabulary: 64 tokens per AND/OR+popcount instruction
+            q_bits = np.array(self._pack_bits(q_ids), dtype=np.uint64)
+            _jaccard_bits_kernel(q_bits, self._kb_bits,
+                                 len(query_tokens) - len(q_ids), out)
+        else:
+            _jaccard_kernel(q_ids, len(query_tokens),
+                            self._tok_ids, self._tok_off, out)
+
+        # Each entry contributed a question span and an answer span
+        scores = np.maximum(out[0::2], out[1::2])
+        if mask is not None:
+            scores = np.where(mask, scores, -1.0)
+        return self._top_k_results(scores, top_k)
+
+    def _search_answers_faiss(self, query: str, top_k: int,
+                              mask: np.ndarray = None) -> List[Dict]:
+        """
+        Search the FAISS index for a single query.
+
+        Args:
+            query: User's question
+            top_k: Number of top results to return
+            mask: Optional boolean mask restricting which entries may match
+
+        Returns:
+            List of top-k relevant Q&A pairs with similarity scores
+        """
+        if mask is None:
+            return self.search_answers_batch([query], top_k)[0]
+
+        # Filtered search: rank everything, then keep the first top_k
+        # entries the mask admits
+        if top_k <= 0 or self.index.ntotal == 0:
+            # FAISS asserts k > 0, so short-circuit degenerate searches
+            return []
+        q_emb = self._embed_texts([query])
+        distances, indices = self.index.search(q_emb, self.index.ntotal)
+
+        results = []
+        for score, idx in zip(distances[0], indices[0]):
+            if idx < 0 or not mask[self.id_map[idx]]:
+                continue
+            result = self._columns.entry(self.id_map[idx])
+            result['similarity_score'] = max(0.0, float(score))
+            results.append(result)
+            if len(results) == top_k:
+                break
+
+        return results
+
+    def search_answers_batch(self, queries: List[str],
+                             top_k: int = 3) -> List[List[Dict]]:
+        """
+        Search for relevant answers to several queries in one pass.
+
+        All queries are embedded into one matrix and resolved with a single
+        index.search call, so the per-call overhead is paid once per batch
+        rather than once per query.
+
+        Args:
+            queries: List of user questions
+            top_k: Number of top results to return per query
+
+        Returns:
+            One list of top-k relevant Q&A pairs per query, in input order
+        """
+        if not queries:
+            return []
+        if self.index is None:
+            # No index available; fall back to per-query search
+            return [self.search_answers(query, top_k) for query in queries]
+        if top_k <= 0 or self.index.ntotal == 0:
+            # FAISS asserts k > 0, so short-circuit degenerate searches
+            return [[] for _ in queries]
+
+        q_emb = self._embed_texts(queries)
+        distances, indices = self.index.search(q_emb, min(top_k, self.index.ntotal))
+
+        batch_results = []
+        for row in range(len(queries)):
+            results = []
+            for score, idx in zip(distances[row], indices[row]):
+                if idx < 0:
+                    continue
+                result = self._columns.entry(self.id_map[idx])
+                result['similarity_score'] = max(0.0, float(score))
+                results.append(result)
+            batch_results.append(results)
+
+        return batch_results
     
     def ask_question(self, question: str, display_results: bool = True) -> List[Dict]:
         """
@@ -192,50 +917,103 @@ class MultilingualQASystem:
         Returns:
             List of relevant answers with metadata
         """
-        print(f"\n{'='*80}")
-        print(f"Query: {question}")
-        print(f"{'='*80}")
-        
         results = self.search_answers(question, top_k=3)
-        
+
         if display_results:
-            if not results or results[0]['similarity_score'] == 0:
-                print("\nNo relevant answers found. Please try a different question.")
-            else:
-                print(f"\nTop {len(results)} relevant answers:\n")
-                for i, result in enumerate(results, 1):
-                    print(f"\n--- Result {i} ---")
-                    print(f"Language: {result['language']}")
-                    print(f"Similarity Score: {result['similarity_score']:.3f}")
-                    print(f"Question: {result['question']}")
-                    print(f"Answer: {result['answer']}")
-                    print(f"Category: {result['category']}")
-        
+            self.display_search_results(question, results)
+        else:
+            print(f"\n{'='*80}\nQuery: {question}\n{'='*80}")
+
         return results
+
+    def format_search_results(self, question: str,
+                              results: List[Dict]) -> str:
+        """
+        Format a query and its search results in the standard layout.
+
+        Args:
+            question: The query the results belong to
+            results: Search results as returned by search_answers
+
+        Returns:
+            The formatted listing as a single string
+        """
+        lines = [f"\n{'='*80}", f"Query: {question}", f"{'='*80}"]
+        lines.extend(self._format_results(results))
+        return '\n'.join(lines)
+
+    def display_search_results(self, question: str, results: List[Dict]):
+        """
+        Print a query and its search results in the standard format.
+
+        Args:
+            question: The query the results belong to
+            results: Search results as returned by search_answers
+        """
+        print(self.format_search_results(question, results))
+
+    @staticmethod
+    def _format_results(results: List[Dict]) -> List[str]:
+        """Format the body of a search result listing as output lines."""
+        if not results or results[0]['similarity_score'] == 0:
+            return ["\nNo relevant answers found. Please try a different question."]
+        lines = [f"\nTop {len(results)} relevant answers:\n"]
+        for i, result in enumerate(results, 1):
+            lines.append(f"\n--- Result {i} ---")
+            lines.append(f"Language: {result['language']}")
+            lines.append(f"Similarity Score: {result['similarity_score']:.3f}")
+            lines.append(f"Question: {result['question']}")
+            lines.append(f"Answer: {result['answer']}")
+            lines.append(f"Category: {result['category']}")
+        return lines
     
-    def add_to_knowledge_base(self, language: str, question: str, 
-                             answer: str, category: str = 'General'):
+    def add_to_knowledge_base(self, language: str, question: str,
+                             answer: str, category: str = 'General',
+                             verbose: bool = True) -> Dict:
         """
         Add a new Q&A pair to the knowledge base.
-        
+
         Args:
             language: Language code (e.g., 'en', 'es', 'fr')
             question: Question text
             answer: Answer text
             category: Category of the Q&A pair
+            verbose: Whether to print a confirmation message
+
+        Returns:
+            The stored entry as a dictionary
         """
-        new_id = max([item['id'] for item in self.knowledge_base]) + 1
-        
-        new_entry = {
-            'id': new_id,
-            'language': language,
-            'question': question,
-            'answer': answer,
-            'category': category
-        }
-        
-        self.knowledge_base.append(new_entry)
-        print(f"\n✓ Successfully added new Q&A pair (ID: {new_id}) to knowledge base!")
+        if self.read_only:
+            raise RuntimeError(
+                'Knowledge base is read-only while attached to a shared index')
+
+        with self._write_lock:
+            # O(1): the next ID is maintained as a running counter
+            new_id = self._next_id
+            self._next_id += 1
+
+            self._columns.append(new_id, language, question, answer, category)
+            qset = self._tokenize(question)
+            aset = self._tokenize(answer)
+            self._q_tokens.append(qset)
+            self._a_tokens.append(aset)
+            self._append_token_spans(qset, aset)
+            self._filter_cache.clear()
+
+            # Keep the FAISS index incremental: embed and add the new entry.
+            # Extend id_map first — a concurrent search may see the vector
+            # as soon as it lands in the index, and must be able to resolve
+            # its id (an extra trailing id_map slot is never dereferenced
+            # since FAISS only returns ids below ntotal)
+            if self.index is not None:
+                self.id_map.append(len(self._columns) - 1)
+                self._index_add(self._embed_texts([question + ' ' + answer]))
+
+            entry = self._columns.entry(len(self._columns) - 1)
+
+        if verbose:
+            print(f"\n✓ Successfully added new Q&A pair (ID: {new_id}) to knowledge base!")
+        return entry
     
     def get_statistics(self) -> Dict:
         """
@@ -244,22 +1022,25 @@ class MultilingualQASystem:
         Returns:
             Dictionary containing various statistics
         """
-        stats = {
-            'total_entries': len(self.knowledge_base),
-            'languages': {},
-            'categories': {}
+        # Count in C: np.bincount over the categorical IDs
+        language_counts = np.bincount(
+            self._columns.language_id_array(),
+            minlength=len(self._columns.language_vocab))
+        category_counts = np.bincount(
+            self._columns.category_id_array(),
+            minlength=len(self._columns.category_vocab))
+
+        return {
+            'total_entries': len(self._columns),
+            'languages': {language: int(count)
+                          for language, count in
+                          zip(self._columns.language_vocab, language_counts)
+                          if count},
+            'categories': {category: int(count)
+                           for category, count in
+                           zip(self._columns.category_vocab, category_counts)
+                           if count}
         }
-        
-        for item in self.knowledge_base:
-            # Count languages
-            lang = item['language']
-            stats['languages'][lang] = stats['languages'].get(lang, 0) + 1
-            
-            # Count categories
-            cat = item['category']
-            stats['categories'][cat] = stats['categories'].get(cat, 0) + 1
-        
-        return stats
     
     def display_statistics(self):
         """Display knowledge base statistics in a formatted way."""
@@ -286,20 +1067,60 @@ class MultilingualQASystem:
         Args:
             filename: Name of the file to save to
         """
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(self.knowledge_base, f, ensure_ascii=False, indent=2)
+        entries = self.knowledge_base
+        if ORJSON_AVAILABLE:
+            # One C-speed serialization pass, written in a single call
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(entries, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filename, 'w', encoding='utf-8') as f:
+                json.dump(entries, f, ensure_ascii=False, indent=2)
+        if self._emb_cache:
+            np.savez_compressed(filename + '.emb.npz', **self._emb_cache)
         print(f"\n✓ Knowledge base saved to {filename}")
+
+    @staticmethod
+    def append_to_knowledge_base_file(filename: str, entry: Dict):
+        """
+        Append one entry to a newline-delimited JSON (.jsonl) file.
+
+        Appending a single line is O(1) in the file size, unlike rewriting
+        the whole knowledge base; load_knowledge_base understands the
+        resulting .jsonl format.
+
+        Args:
+            filename: Name of the .jsonl file to append to
+            entry: Knowledge base entry dictionary
+        """
+        if ORJSON_AVAILABLE:
+            line = orjson.dumps(entry) + b'\n'
+        else:
+            line = (json.dumps(entry, ensure_ascii=False) + '\n').encode('utf-8')
+        with open(filename, 'ab') as f:
+            f.write(line)
     
     def load_knowledge_base(self, filename: str = 'knowledge_base.json'):
         """
         Load knowledge base from a JSON file.
         
         Args:
-            filename: Name of the file to load from
+            filename: Name of the file to load from (.json or .jsonl)
         """
+        loads = orjson.loads if ORJSON_AVAILABLE else json.loads
         if os.path.exists(filename):
-            with open(filename, 'r', encoding='utf-8') as f:
-                self.knowledge_base = json.load(f)
+            with open(filename, 'rb') as f:
+                if filename.endswith('.jsonl'):
+                    # Newline-delimited entries, one per line
+                    entries = [loads(line) for line in f if line.strip()]
+                else:
+                    entries = loads(f.read())
+            # Warm the embedding cache first so the index rebuild triggered
+            # by the setter reuses the saved vectors
+            cache_file = filename + '.emb.npz'
+            if os.path.exists(cache_file):
+                with np.load(cache_file) as cached:
+                    self._emb_cache.update(cached)
+            self.knowledge_base = entries
             print(f"\n✓ Knowledge base loaded from {filename}")
         else:
             print(f"\n✗ File {filename} not found!")
@@ -331,8 +1152,12 @@ def demonstrate_system():
     print("DEMONSTRATION: Cross-lingual Question Answering")
     print("="*80)
     
-    for question in demo_questions:
-        qa_system.ask_question(question)
+    # One batched search resolves every demo query in a single index pass,
+    # and all listings are rendered with a single write to stdout
+    results_per_query = qa_system.search_answers_batch(demo_questions, top_k=3)
+    print('\n'.join(qa_system.format_search_results(question, results)
+                    for question, results in zip(demo_questions,
+                                                 results_per_query)))
     
     # Add a new entry
     print("\n" + "="*80)
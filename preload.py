@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+Shared-Index Preload Hook for the Web Interface
+================================================
+
+Builds the FAISS index once and exports it (with the knowledge base and
+embedding matrix) to a shared-memory directory. Worker processes started
+afterwards attach to the exported files via memory-mapping, so N Gunicorn
+workers share a single resident copy of the index instead of each building
+and holding its own.
+
+Usage:
+    python preload.py                         # export to /dev/shm/lareqa
+    LAREQA_SHARED_DIR=/tmp/lareqa python preload.py
+
+    # Then start workers that attach to the shared index:
+    LAREQA_SHARED_DIR=/dev/shm/lareqa gunicorn --preload web_interface:app
+"""
+
+import os
+
+from multilingual_qa_system import MultilingualQASystem
+
+# Workers look for the shared index in the same directory
+SHARED_DIR = os.environ.get('LAREQA_SHARED_DIR', '/dev/shm/lareqa')
+
+# Knowledge base file used by the web interface, replayed into the export
+WEB_KNOWLEDGE_BASE = 'web_knowledge_base.json'
+
+
+def build_shared_index(directory: str = SHARED_DIR):
+    """
+    Build the QA system once and export its index for worker processes.
+
+    Args:
+        directory: Destination directory for the shared files
+    """
+    qa_system = MultilingualQASystem()
+
+    if os.path.exists(WEB_KNOWLEDGE_BASE):
+        qa_system.load_knowledge_base(WEB_KNOWLEDGE_BASE)
+
+    qa_system.export_shared_index(directory)
+    return qa_system
+
+
+if __name__ == '__main__':
+    build_shared_index()
@@ -18,13 +18,73 @@ Features:
 
 from flask import Flask, render_template, request, jsonify, redirect, url_for
 from multilingual_qa_system import MultilingualQASystem
+import json
 import os
+import threading
 
 app = Flask(__name__)
 app.config['SECRET_KEY'] = 'lareqa-multilingual-qa-secret-key-2024'
 
-# Initialize the QA system globally
-qa_system = MultilingualQASystem()
+# Persistence files: new entries are appended to a small write-ahead log
+# on each /add and periodically folded into the consolidated snapshot,
+# instead of rewriting the whole knowledge base inside the request.
+WEB_KNOWLEDGE_BASE = 'web_knowledge_base.json'
+WAL_FILE = 'web_knowledge_base.wal.jsonl'
+WAL_CONSOLIDATE_SECONDS = 60
+
+_wal_lock = threading.Lock()
+
+# Initialize the QA system globally. When LAREQA_SHARED_DIR points at an
+# index exported by preload.py, workers attach to it read-only via mmap
+# instead of each building a private copy.
+qa_system = MultilingualQASystem(
+    shared_index_dir=os.environ.get('LAREQA_SHARED_DIR'))
+
+
+def _restore_knowledge_base():
+    """Load the consolidated snapshot, then replay write-ahead log entries."""
+    if os.path.exists(WEB_KNOWLEDGE_BASE):
+        qa_system.load_knowledge_base(WEB_KNOWLEDGE_BASE)
+    if os.path.exists(WAL_FILE):
+        with open(WAL_FILE, 'rb') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                qa_system.add_to_knowledge_base(
+                    entry['language'], entry['question'], entry['answer'],
+                    entry.get('category', 'General'), verbose=False)
+
+
+def _consolidate_wal():
+    """Fold logged entries into the snapshot and reschedule."""
+    try:
+        with _wal_lock:
+            if os.path.exists(WAL_FILE):
+                tmp_file = WEB_KNOWLEDGE_BASE + '.tmp'
+                # Hold the system's write lock while snapshotting so an
+                # in-flight add cannot mutate the columns mid-serialization
+                with qa_system._write_lock:
+                    qa_system.save_knowledge_base(tmp_file)
+                os.replace(tmp_file, WEB_KNOWLEDGE_BASE)
+                if os.path.exists(tmp_file + '.emb.npz'):
+                    os.replace(tmp_file + '.emb.npz',
+                               WEB_KNOWLEDGE_BASE + '.emb.npz')
+                os.remove(WAL_FILE)
+    finally:
+        # Reschedule even if one pass fails; otherwise the timer chain
+        # would silently stop consolidating
+        timer = threading.Timer(WAL_CONSOLIDATE_SECONDS, _consolidate_wal)
+        timer.daemon = True
+        timer.start()
+
+
+if not qa_system.read_only:
+    _restore_knowledge_base()
+    _consolidate_timer = threading.Timer(WAL_CONSOLIDATE_SECONDS,
+                                         _consolidate_wal)
+    _consolidate_timer.daemon = True
+    _consolidate_timer.start()
 
 @app.route('/')
 def index():
@@ -64,6 +124,39 @@ def ask_question():
         'message': f'Found {len(results)} relevant answer(s)'
     })
 
+@app.route('/ask_batch', methods=['POST'])
+def ask_questions_batch():
+    """
+    Handle a batch of questions in one search pass.
+
+    Expects a JSON body with a "questions" list and returns one result
+    list per question, in input order.
+
+    Returns:
+        JSON response with per-question search results
+    """
+    data = request.get_json()
+    questions = data.get('questions', [])
+
+    if not isinstance(questions, list) or not questions:
+        return jsonify({'error': 'Please provide a non-empty list of questions'}), 400
+
+    questions = [str(question).strip() for question in questions]
+    if not all(questions):
+        return jsonify({'error': 'Questions must be non-empty strings'}), 400
+
+    batch_results = qa_system.search_answers_batch(questions, top_k=5)
+
+    return jsonify({
+        'responses': [
+            {
+                'question': question,
+                'results': [r for r in results if r['similarity_score'] > 0]
+            }
+            for question, results in zip(questions, batch_results)
+        ]
+    })
+
 @app.route('/add', methods=['POST'])
 def add_knowledge():
     """
@@ -72,8 +165,11 @@ def add_knowledge():
     Returns:
         JSON response with success or error message
     """
+    if qa_system.read_only:
+        return jsonify({'error': 'Knowledge base is read-only in shared-index mode'}), 403
+
     data = request.get_json()
-    
+
     language = data.get('language', '').strip()
     question = data.get('question', '').strip()
     answer = data.get('answer', '').strip()
@@ -86,12 +182,14 @@ def add_knowledge():
     if language not in qa_system.supported_languages:
         return jsonify({'error': f'Unsupported language. Supported: {", ".join(qa_system.supported_languages)}'}), 400
     
-    # Add to knowledge base
-    qa_system.add_to_knowledge_base(language, question, answer, category)
-    
-    # Save to file
-    qa_system.save_knowledge_base('web_knowledge_base.json')
-    
+    # Add and log under one lock so a concurrent consolidation cannot
+    # snapshot the entry and then see it re-logged into a fresh WAL
+    # (which would duplicate it on restart replay)
+    with _wal_lock:
+        entry = qa_system.add_to_knowledge_base(language, question, answer,
+                                                category, verbose=False)
+        MultilingualQASystem.append_to_knowledge_base_file(WAL_FILE, entry)
+
     return jsonify({
         'success': True,
         'message': 'Q&A pair added successfully!'